@@ -1,52 +1,246 @@
+import os
+import re
 import sys
 import json
+import hashlib
+import diskcache
+import orjson
 import requests
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+import lxml.etree as ET
 from packaging import version
-from datetime import date
+from datetime import date, datetime, timezone
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import spring_boot_mappings
 from spring_boot_mappings import spring_boot_to_framework, spring_boot_to_liquibase
 
+# The newest release has the tag "latest"
+ENDOFLIFE_URL = "https://github.com/HenryJobst/endoflife.json/releases/download/latest/endoflife.json"
+CACHE_DIR = os.path.expanduser("~/.cache/endoflife")
+# (connect, read) timeout in seconds, so a stalled download falls back to the cache
+DOWNLOAD_TIMEOUT = (5, 30)
+# Seconds a dependency report stays cached for unchanged inputs
+REPORT_CACHE_EXPIRE = 3600
+PACKAGE_JSON_FILE = "frontend/package.json"
+POM_FILE = "backend/pom.xml"
+EXCLUDED_DEPENDENCIES_FILE = "excluded_dependencies.json"
+
+# Plain MAJOR[.MINOR[.PATCH]] versions whose parts fit into 20 bits each
+_packable_version = re.compile(r"(\d{1,6})(?:\.(\d{1,6}))?(?:\.(\d{1,6}))?", re.ASCII)
+
+# The pattern packaging.version.Version accepts, to check before parsing
+_pep440_version = re.compile(
+    r"^\s*" + version.VERSION_PATTERN + r"\s*$", re.VERBOSE | re.IGNORECASE
+)
+
+# npm lower-bound range operators and version decorations that
+# packaging.version rejects. Upper bounds (<, <=) are kept so that such specs
+# fall back to string comparison instead of passing as their bound.
+_npm_range_prefix = re.compile(r"^[\^~>=v\s]+")
+_npm_version_suffix = re.compile(r"\+.*$|-SNAPSHOT$|(?:\.[xX*])+$")
+# npm specs that accept any version, and so always resolve to the latest
+_npm_any_version = frozenset(("*", "x", "X"))
+
+POM_NS = "http://maven.apache.org/POM/4.0.0"
+
+# Namespaced pom.xml tags in Clark notation, so lookups skip prefix resolution
+_pom_ns = f"{{{POM_NS}}}"
+_properties_tag = _pom_ns + "properties"
+_parent_tag = _pom_ns + "parent"
+_dependency_tag = _pom_ns + "dependency"
+_group_id_tag = _pom_ns + "groupId"
+_artifact_id_tag = _pom_ns + "artifactId"
+_version_tag = _pom_ns + "version"
+
+# Tags streamed out of pom.xml; everything else is discarded while parsing
+_pom_tags = (_properties_tag, _parent_tag, _dependency_tag)
+
+
+def _child_text(element, tag):
+    # Return the text of the first child with the given tag, or None
+    child = element.find(tag)
+    return child.text if child is not None else None
+
+
+def read_pom(path):
+    # Stream pom.xml once and return (properties, parent, dependencies).
+    # parent and each dependency are (groupId, artifactId, version) tuples,
+    # with None for missing elements.
+    properties = {}
+    parent = None
+    dependencies = []
 
-def load_endoflife_data():
-    # The newest release has the tag "latest"
-    download_url = "https://github.com/HenryJobst/endoflife.json/releases/download/latest/endoflife.json"
+    for _, elem in ET.iterparse(path, events=("end",), tag=_pom_tags):
+        if elem.tag == _properties_tag:
+            for prop in elem.iterchildren(tag=ET.Element):
+                properties[ET.QName(prop).localname] = prop.text
+        else:
+            coordinates = (
+                _child_text(elem, _group_id_tag),
+                _child_text(elem, _artifact_id_tag),
+                _child_text(elem, _version_tag),
+            )
+            if elem.tag == _dependency_tag:
+                dependencies.append(coordinates)
+            elif parent is None:
+                parent = coordinates
+
+        # Release the processed subtree and everything before it
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+    return properties, parent, dependencies
 
-    # Fetch the endoflife.json file
-    response = requests.get(download_url)
-    response.raise_for_status()
-    return response.json()
+
+def _create_session():
+    # Pooled connections with retries; requests already negotiates gzip and,
+    # if a brotli package is installed, br content encoding
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)
+            ),
+        ),
+    )
+    return session
+
+
+_session = _create_session()
+
+
+def load_endoflife_data():
+    with diskcache.Cache(CACHE_DIR) as cache:
+        # Cached entries are (etag, last_modified, json_bytes, stored_at)
+        cached = cache.get(ENDOFLIFE_URL)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        # Fetch the endoflife.json file, unless the cached copy is still current
+        try:
+            response = _session.get(
+                ENDOFLIFE_URL, headers=headers, timeout=DOWNLOAD_TIMEOUT
+            )
+            if response.status_code == 304 and cached is not None:
+                return orjson.loads(cached[2])
+            response.raise_for_status()
+        except requests.RequestException as e:
+            # Fall back to the last downloaded copy if there is one
+            if cached is None:
+                raise
+            print(
+                f"Warning: could not download endoflife.json ({e}), "
+                f"using the cached copy stored at {cached[3]}",
+                file=sys.stderr,
+            )
+            return orjson.loads(cached[2])
+
+        cache.set(
+            ENDOFLIFE_URL,
+            (
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                response.content,
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            ),
+        )
+        return orjson.loads(response.content)
 
 
-def get_current_date():
-    return date.today().isoformat()
+def _eol_date(value):
+    # Parse an ISO eol date, or return None for booleans and labels like
+    # "Security Support"
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
 
 
 def get_supported_versions(product_data):
-    current_date = get_current_date()
-    return [
-        entry
-        for entry in product_data
-        if entry.get("eol") and entry["eol"] > current_date
-    ]
+    # Compare as dates; entries without an ISO eol date are not supported
+    today = date.today()
+    supported = []
+    for entry in product_data:
+        eol = _eol_date(entry.get("eol"))
+        if eol is not None and eol > today:
+            supported.append(entry)
+    return supported
+
+
+@lru_cache(maxsize=4096)
+def parse_version(value):
+    return version.parse(value)
+
+
+def pack_version(value):
+    # Pack a plain numeric version into a single int that orders like the
+    # version itself, or return None if it needs packaging.version
+    match = _packable_version.fullmatch(value) if isinstance(value, str) else None
+    if match is None:
+        return None
+    major, minor, patch = (int(part or 0) for part in match.groups())
+    return (major << 40) | (minor << 20) | patch
+
+
+def is_valid_version(value):
+    # Check whether parse_version would succeed, without raising
+    return isinstance(value, str) and _pep440_version.match(value) is not None
+
+
+def _parse_valid_versions(names):
+    return [parse_version(name) for name in names if is_valid_version(name)]
+
+
+def build_supported_index(eol_data):
+    # Map each product with release data to its supported (not EOL) versions,
+    # newest first, so the checks below don't rescan the releases per dependency.
+    # Each entry holds the release names, their parsed versions and, if all of
+    # them are plain numeric versions, their packed integer form. Parsed and
+    # packed versions are sorted ascending for bisection.
+    index = {}
+    for name, data in eol_data.items():
+        if "releases" not in (data.get("result") or {}):
+            continue
+        names = [
+            v["name"] for v in data["result"]["releases"] if not v.get("isEol", True)
+        ]
+        packed = [pack_version(n) for n in names]
+        index[name] = {
+            "strings": names,
+            "parsed": sorted(_parse_valid_versions(names)),
+            "packed": array("q", sorted(packed)) if None not in packed else None,
+        }
+    return index
+
+
+def read_package_json(path):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
-def check_npm_versions(path, eol_data):
-    with open(path) as f:
-        pkg = json.load(f)
+def check_npm_versions(path, supported_index, pkg=None):
+    if pkg is None:
+        pkg = read_package_json(path)
     deps = pkg.get("dependencies", {})
     result = {}
-    current_date = get_current_date()
     for dep, ver in deps.items():
-        if (
-            dep in eol_data
-            and "result" in eol_data[dep]
-            and "releases" in eol_data[dep]["result"]
-        ):
-            releases = eol_data[dep]["result"]["releases"]
-            # Find the latest supported version (not EOL)
-            latest_supported = next(
-                (v["name"] for v in releases if not v.get("isEol", True)), None
-            )
+        if dep in supported_index:
+            # The latest supported version (not EOL) comes first
+            supported_versions = supported_index[dep]["strings"]
+            latest_supported = supported_versions[0] if supported_versions else None
             result[dep] = {"used": ver, "latest_supported": latest_supported}
         else:
             result[dep] = {
@@ -56,64 +250,49 @@ def check_npm_versions(path, eol_data):
     return result
 
 
-def check_maven_versions(path, eol_data):
-    tree = ET.parse(path)
-    root = tree.getroot()
-    ns = {"m": "http://maven.apache.org/POM/4.0.0"}
-
-    # Extract all properties from the pom.xml
-    properties = {}
-    for prop in root.findall(".//m:properties/*", ns):
-        properties[prop.tag.replace("{http://maven.apache.org/POM/4.0.0}", "")] = (
-            prop.text
-        )
+def check_maven_versions(path, supported_index, pom=None):
+    if pom is None:
+        pom = read_pom(path)
+    properties, parent, dependencies = pom
 
     result = {}
 
+    # The Spring Boot MAJOR.MINOR line of the parent, used to look up the
+    # versions it manages
+    parent_ver = parent[2] if parent is not None else None
+    spring_boot_line = (
+        ".".join(parent_ver.strip().split(".")[:2]) if parent_ver else None
+    )
+
     # Check parent dependency
-    parent = root.find(".//m:parent", ns)
     if parent is not None:
-        parent_group = parent.find("m:groupId", ns)
-        parent_artifact = parent.find("m:artifactId", ns)
-        parent_version = parent.find("m:version", ns)
+        parent_group, parent_artifact, parent_ver = parent
 
         if (
             parent_group is not None
             and parent_artifact is not None
-            and parent_version is not None
+            and parent_ver is not None
         ):
-            parent_name = parent_artifact.text.lower()
-            parent_group_name = parent_group.text.lower()
-            parent_ver = parent_version.text
+            parent_name = parent_artifact.lower()
+            parent_group_name = parent_group.lower()
 
             # For spring-boot-starter-parent, we need to check against spring-boot
             if (
                 parent_name == "spring-boot-starter-parent"
-                and "spring-boot" in eol_data
-                and "result" in eol_data["spring-boot"]
-                and "releases" in eol_data["spring-boot"]["result"]
+                and "spring-boot" in supported_index
             ):
-                releases = eol_data["spring-boot"]["result"]["releases"]
-                supported_versions = [
-                    v["name"] for v in releases if not v.get("isEol", True)
-                ]
                 result[parent_name] = {
                     "used": parent_ver,
-                    "supported_versions": supported_versions,
+                    "product": "spring-boot",
+                    "supported_versions": supported_index["spring-boot"]["strings"],
                 }
 
                 # Also check spring-framework when spring-boot is used
-                if (
-                    "spring-framework" in eol_data
-                    and "result" in eol_data["spring-framework"]
-                    and "releases" in eol_data["spring-framework"]["result"]
-                ):
+                if "spring-framework" in supported_index:
                     # Determine Spring Framework version based on Spring Boot version
-                    spring_framework_version = None
-                    for sb_version, sf_version in spring_boot_to_framework.items():
-                        if parent_ver.startswith(sb_version):
-                            spring_framework_version = sf_version
-                            break
+                    spring_framework_version = spring_boot_to_framework.get(
+                        spring_boot_line
+                    )
 
                     # If no mapping found, use the version from properties if available
                     if (
@@ -127,17 +306,12 @@ def check_maven_versions(path, eol_data):
                     if spring_framework_version is None:
                         spring_framework_version = "6.2.5"  # Default fallback
 
-                    spring_framework_releases = eol_data["spring-framework"]["result"][
-                        "releases"
-                    ]
-                    spring_framework_supported_versions = [
-                        v["name"]
-                        for v in spring_framework_releases
-                        if not v.get("isEol", True)
-                    ]
                     result["spring-framework"] = {
                         "used": spring_framework_version,
-                        "supported_versions": spring_framework_supported_versions,
+                        "product": "spring-framework",
+                        "supported_versions": supported_index["spring-framework"][
+                            "strings"
+                        ],
                     }
             else:
                 result[parent_name] = {
@@ -146,65 +320,55 @@ def check_maven_versions(path, eol_data):
                 }
 
     # Check java version
-    if (
-        "java.version" in properties
-        and "java" in eol_data
-        and "result" in eol_data["java"]
-        and "releases" in eol_data["java"]["result"]
-    ):
-        java_version = properties["java.version"]
-        releases = eol_data["java"]["result"]["releases"]
-        supported_versions = [v["name"] for v in releases if not v.get("isEol", True)]
+    if "java.version" in properties and "java" in supported_index:
         result["java"] = {
-            "used": java_version,
-            "supported_versions": supported_versions,
+            "used": properties["java.version"],
+            "product": "java",
+            "supported_versions": supported_index["java"]["strings"],
         }
 
     # Load excluded dependencies from JSON file
-    with open("excluded_dependencies.json") as f:
+    with open(EXCLUDED_DEPENDENCIES_FILE) as f:
         excluded_combinations = set(
             (item["group"], item["name"]) for item in json.load(f)
         )
 
-    # Check regular dependencies
-    for dep in root.findall(".//m:dependency", ns):
-        artifact = dep.find("m:artifactId", ns)
-        group_id = dep.find("m:groupId", ns)
-        version_el = dep.find("m:version", ns)
+    # Determine Liquibase version based on Spring Boot version,
+    # with a default fallback if no mapping is found
+    liquibase_version = spring_boot_to_liquibase.get(spring_boot_line, "4.26.0")
+
+    # Local aliases for the lookups in the dependency loop
+    get_supported = supported_index.get
+    get_property = properties.get
 
+    # Check regular dependencies
+    for group_id, artifact, ver in dependencies:
         if artifact is not None:
-            name = artifact.text.lower()
-            group_name = group_id.text.lower() if group_id is not None else ""
+            name = artifact.lower()
+            group_name = group_id.lower() if group_id is not None else ""
 
             # Handle dependencies with explicit versions
-            if version_el is not None:
-                ver = version_el.text
-
+            if ver is not None:
                 # Resolve property references in version
                 if ver and ver.startswith("${"):
                     # Extract property name, handling cases where there might be whitespace or newlines
                     prop_ref = ver.strip()
                     if prop_ref.endswith("}"):
-                        prop_name = prop_ref[2:-1]  # Remove ${ and }
-                        if prop_name in properties:
-                            ver = properties[
-                                prop_name
-                            ].strip()  # Strip whitespace from resolved version
-
-                if (
-                    (group_name, name) not in excluded_combinations
-                    and name in eol_data
-                    and "result" in eol_data[name]
-                    and "releases" in eol_data[name]["result"]
-                ):
-                    releases = eol_data[name]["result"]["releases"]
-                    # Get all supported versions (not EOL)
-                    supported_versions = [
-                        v["name"] for v in releases if not v.get("isEol", True)
-                    ]
+                        prop_value = get_property(prop_ref[2:-1])  # Remove ${ and }
+                        if prop_value is not None:
+                            # Strip whitespace from resolved version
+                            ver = prop_value.strip()
+
+                supported = (
+                    get_supported(name)
+                    if (group_name, name) not in excluded_combinations
+                    else None
+                )
+                if supported is not None:
                     result[name] = {
                         "used": ver,
-                        "supported_versions": supported_versions,
+                        "product": name,
+                        "supported_versions": supported["strings"],
                     }
                 else:
                     result[name] = {
@@ -216,47 +380,37 @@ def check_maven_versions(path, eol_data):
             else:
                 # Special handling for known dependencies
                 if name == "liquibase-core" and group_name == "org.liquibase":
-                    # For liquibase, we need to determine the version based on Spring Boot version
-                    # Get the parent Spring Boot version
-                    parent_ver = None
-                    parent_element = root.find(".//m:parent/m:version", ns)
-                    if parent_element is not None:
-                        parent_ver = parent_element.text
-
-                    # Determine Liquibase version based on Spring Boot version
-                    liquibase_version = None
-                    if parent_ver:
-                        for sb_version, lq_version in spring_boot_to_liquibase.items():
-                            if parent_ver.startswith(sb_version):
-                                liquibase_version = lq_version
-                                break
-
-                    # Fallback to default if no mapping found
-                    if liquibase_version is None:
-                        liquibase_version = "4.26.0"  # Default fallback
-
-                    if (
-                        "liquibase" in eol_data
-                        and "result" in eol_data["liquibase"]
-                        and "releases" in eol_data["liquibase"]["result"]
-                    ):
-                        releases = eol_data["liquibase"]["result"]["releases"]
-                        supported_versions = [
-                            v["name"] for v in releases if not v.get("isEol", True)
-                        ]
+                    # For liquibase, the version is managed by the Spring Boot parent
+                    if "liquibase" in supported_index:
                         result["liquibase"] = {
                             "used": liquibase_version,
-                            "supported_versions": supported_versions,
+                            "product": "liquibase",
+                            "supported_versions": supported_index["liquibase"][
+                                "strings"
+                            ],
                         }
     return result
 
 
-def main():
-    eol_data = load_endoflife_data()
+def _file_key(path):
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+def _index_fingerprint(supported_index):
+    # The report only depends on the supported release names
+    names = {name: entry["strings"] for name, entry in supported_index.items()}
+    return hashlib.sha1(orjson.dumps(names, option=orjson.OPT_SORT_KEYS)).hexdigest()
 
-    # Get reports
-    frontend_report = check_npm_versions("frontend/package.json", eol_data)
-    backend_report = check_maven_versions("backend/pom.xml", eol_data)
+
+def build_report(supported_index, pkg_future, pom_future):
+    # Get reports from the already started package.json and pom.xml reads
+    frontend_report = check_npm_versions(
+        PACKAGE_JSON_FILE, supported_index, pkg_future.result()
+    )
+    backend_report = check_maven_versions(
+        POM_FILE, supported_index, pom_future.result()
+    )
 
     # Process frontend dependencies
     frontend_eol = {}
@@ -269,33 +423,35 @@ def main():
             frontend_unchecked[dep] = info
         elif "latest_supported" in info:
             # Check if the dependency is end-of-life
-            # Strip version prefixes like ^ or ~ for npm packages
-            used_version = info["used"]
-            if used_version.startswith(("^", "~", ">")):
-                used_version = used_version[1:]
-
-            # Use packaging.version for proper semantic version comparison
-            try:
-                if version.parse(used_version) < version.parse(
+            # Strip lower-bound operators like ^, ~ or >= for npm packages and
+            # keep the lower bound of ranges like ">=1.2 <2" or "1.x || 2.x"
+            ranges = _npm_range_prefix.sub("", info["used"]).split()
+            used_version = (
+                _npm_version_suffix.sub("", ranges[0]) if ranges else info["used"]
+            )
+
+            if not ranges or ranges[0] in _npm_any_version:
+                # "*", "x" or an empty spec accept any version, including the latest
+                is_eol = False
+            elif is_valid_version(used_version) and is_valid_version(
+                info["latest_supported"]
+            ):
+                # Use packaging.version for proper semantic version comparison
+                is_eol = parse_version(used_version) < parse_version(
                     info["latest_supported"]
-                ):
-                    frontend_eol[dep] = {
-                        "used": info["used"],
-                        "required": info["latest_supported"],
-                    }
-                else:
-                    # Dependency is up-to-date
-                    frontend_up_to_date[dep] = {"used": info["used"]}
-            except (TypeError, ValueError):
-                # If version parsing fails, fall back to string comparison
-                if info["used"] != info["latest_supported"]:
-                    frontend_eol[dep] = {
-                        "used": info["used"],
-                        "required": info["latest_supported"],
-                    }
-                else:
-                    # Dependency is up-to-date
-                    frontend_up_to_date[dep] = {"used": info["used"]}
+                )
+            else:
+                # If the versions can't be parsed, fall back to string comparison
+                is_eol = info["used"] != info["latest_supported"]
+
+            if is_eol:
+                frontend_eol[dep] = {
+                    "used": info["used"],
+                    "required": info["latest_supported"],
+                }
+            else:
+                # Dependency is up-to-date
+                frontend_up_to_date[dep] = {"used": info["used"]}
             # If used version matches latest_supported, it's up-to-date
 
     # Process backend dependencies
@@ -309,97 +465,39 @@ def main():
             backend_unchecked[dep] = info
         elif "supported_versions" in info:
             # Check if the dependency is end-of-life
-            if info["supported_versions"]:
-                # Use packaging.version for proper semantic version comparison
-                try:
-                    used_ver = version.parse(info["used"])
-                    # Check if any supported version is greater than or equal to the used version
-                    is_supported = any(
-                        version.parse(v) <= used_ver for v in info["supported_versions"]
-                    )
-
-                    if not is_supported:
-                        backend_eol[dep] = {
-                            "used": info["used"],
-                            "required": info["supported_versions"][
-                                0
-                            ],  # Use first supported version
-                        }
-                    else:
-                        # Dependency is up-to-date
-                        backend_up_to_date[dep] = {"used": info["used"]}
-                except (TypeError, ValueError):
+            supported = supported_index[info["product"]]
+            if supported["strings"]:
+                used_packed = pack_version(info["used"])
+                used_ver = None
+                if (used_packed is None or not supported["packed"]) and (
+                    is_valid_version(info["used"])
+                ):
+                    # Use packaging.version for proper semantic version comparison
+                    used_ver = parse_version(info["used"])
+
+                if used_packed is not None and supported["packed"]:
+                    # Plain numeric versions compare as packed integers
+                    is_supported = bisect_right(supported["packed"], used_packed) > 0
+                elif used_ver is not None and supported["parsed"]:
+                    # Check if any supported version is less than or equal to the used version
+                    is_supported = bisect_right(supported["parsed"], used_ver) > 0
+                else:
                     # If version parsing fails, fall back to string comparison
-                    if info["used"] not in info["supported_versions"]:
-                        backend_eol[dep] = {
-                            "used": info["used"],
-                            "required": info["supported_versions"][
-                                0
-                            ],  # Use first supported version
-                        }
-                    else:
-                        # Dependency is up-to-date
-                        backend_up_to_date[dep] = {"used": info["used"]}
-            # If used version is in supported_versions, it's up-to-date
+                    is_supported = info["used"] in supported["strings"]
 
-    # Print the reports in a compact, table-like format
-    print("=== Frontend ===")
-    print("End-of-life dependencies:")
-    if frontend_eol:
-        print(f"{'Dependency':<30} {'Used Version':<20} {'Required Version':<20}")
-        print("-" * 70)
-        for dep, info in frontend_eol.items():
-            print(f"{dep:<30} {info['used']:<20} {info['required']:<20}")
-    else:
-        print("None")
-
-    print("\nUp-to-date dependencies:")
-    if frontend_up_to_date:
-        print(f"{'Dependency':<30} {'Used Version':<20}")
-        print("-" * 50)
-        for dep, info in frontend_up_to_date.items():
-            print(f"{dep:<30} {info['used']:<20}")
-    else:
-        print("None")
-
-    print("\nUnchecked dependencies:")
-    if frontend_unchecked:
-        print(f"{'Dependency':<30} {'Used Version':<20}")
-        print("-" * 50)
-        for dep, info in frontend_unchecked.items():
-            print(f"{dep:<30} {info['used']:<20}")
-    else:
-        print("None")
-
-    print("\n=== Backend ===")
-    print("End-of-life dependencies:")
-    if backend_eol:
-        print(f"{'Dependency':<30} {'Used Version':<20} {'Required Version':<20}")
-        print("-" * 70)
-        for dep, info in backend_eol.items():
-            print(f"{dep:<30} {info['used']:<20} {info['required']:<20}")
-    else:
-        print("None")
-
-    print("\nUp-to-date dependencies:")
-    if backend_up_to_date:
-        print(f"{'Dependency':<30} {'Used Version':<20}")
-        print("-" * 50)
-        for dep, info in backend_up_to_date.items():
-            print(f"{dep:<30} {info['used']:<20}")
-    else:
-        print("None")
-
-    print("\nUnchecked dependencies:")
-    if backend_unchecked:
-        print(f"{'Dependency':<30} {'Used Version':<20}")
-        print("-" * 50)
-        for dep, info in backend_unchecked.items():
-            print(f"{dep:<30} {info['used']:<20}")
-    else:
-        print("None")
+                if not is_supported:
+                    backend_eol[dep] = {
+                        "used": info["used"],
+                        "required": supported["strings"][
+                            0
+                        ],  # Use first supported version
+                    }
+                else:
+                    # Dependency is up-to-date
+                    backend_up_to_date[dep] = {"used": info["used"]}
+            # If used version is in supported_versions, it's up-to-date
 
-    report = {
+    return {
         "has_endoflife": bool(frontend_eol or backend_eol),
         "frontend": {
             "eol": frontend_eol,
@@ -413,6 +511,83 @@ def main():
         },
     }
 
+
+def cached_report(supported_index, fingerprint, pkg_future, pom_future):
+    # Return the dependency report from the disk cache if none of its inputs
+    # changed: the project files, the exclusions, the Spring Boot mappings,
+    # this script and the endoflife data (via its fingerprint)
+    key = (
+        *(
+            part
+            for path in (
+                PACKAGE_JSON_FILE,
+                POM_FILE,
+                EXCLUDED_DEPENDENCIES_FILE,
+                spring_boot_mappings.__file__,
+                __file__,
+            )
+            for part in _file_key(path)
+        ),
+        fingerprint,
+    )
+    with diskcache.Cache(CACHE_DIR) as cache:
+        report = cache.get(key)
+        if report is None:
+            report = build_report(supported_index, pkg_future, pom_future)
+            cache.set(key, report, expire=REPORT_CACHE_EXPIRE)
+    return report
+
+
+# Report table columns as (header, info key) pairs
+_eol_columns = (("Used Version", "used"), ("Required Version", "required"))
+_used_columns = (("Used Version", "used"),)
+
+
+def print_section(title, rows, columns):
+    # Print one report section as a table with a 30 character dependency
+    # column followed by 20 character columns
+    print(title)
+    if not rows:
+        print("None")
+        return
+    print(
+        " ".join([f"{'Dependency':<30}"] + [f"{header:<20}" for header, _ in columns])
+    )
+    print("-" * (30 + 20 * len(columns)))
+    for dep, info in rows.items():
+        print(" ".join([f"{dep:<30}"] + [f"{info[key]:<20}" for _, key in columns]))
+
+
+def main():
+    # Download endoflife.json while the project files are being read; the
+    # reads are speculative and their results are dropped on a cache hit
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        eol_future = executor.submit(load_endoflife_data)
+        pkg_future = executor.submit(read_package_json, PACKAGE_JSON_FILE)
+        pom_future = executor.submit(read_pom, POM_FILE)
+
+        supported_index = build_supported_index(eol_future.result())
+
+        # Reuse the cached report if nothing changed since the last run
+        report = cached_report(
+            supported_index,
+            _index_fingerprint(supported_index),
+            pkg_future,
+            pom_future,
+        )
+
+    # Print the reports in a compact, table-like format
+    for title, sections in (
+        ("=== Frontend ===", report["frontend"]),
+        ("\n=== Backend ===", report["backend"]),
+    ):
+        print(title)
+        print_section("End-of-life dependencies:", sections["eol"], _eol_columns)
+        print_section(
+            "\nUp-to-date dependencies:", sections["up_to_date"], _used_columns
+        )
+        print_section("\nUnchecked dependencies:", sections["unchecked"], _used_columns)
+
     with open("dependency_report.json", "w") as f:
         json.dump(report, f, indent=2)
 